@@ -1,5 +1,12 @@
 import math
-import random
+import os
+
+import numpy as np
+
+# Shared random generator; override the seed with MATHEVAL_SEED
+SEED = int(os.environ.get("MATHEVAL_SEED", 42))
+rng = np.random.default_rng(SEED)
+
 
 def black_scholes_monte_carlo():
     print("=== Financial Example: Black-Scholes Option Pricing (Python) ===")
@@ -21,23 +28,18 @@ def black_scholes_monte_carlo():
     vol_part = sigma * math.sqrt(T)
     S_det = S * math.exp(drift)
     
-    total_payoff = 0.0
-    
-    # Monte Carlo Loop
-    # In Python, this loop is significantly slower than Rust for large N
-    for _ in range(simulations):
-        # Generate standard normal random variable Z
-        Z = random.gauss(0.0, 1.0)
-        
-        # Calculate S_final
-        # Formula: S_final = S * exp((r - 0.5*sigma^2)*T + sigma*sqrt(T)*Z)
-        # Optimized: S_final = S_det * exp(vol_part * Z)
-        S_final = S_det * math.exp(vol_part * Z)
-        
-        # Calculate Payoff
-        payoff = max(S_final - K, 0) * discount
-        total_payoff += payoff
-        
+    # Monte Carlo
+    # Draw every Z up front and let NumPy run the payoff math as C loops,
+    # instead of paying interpreter overhead once per path.
+    # Formula: S_final = S * exp((r - 0.5*sigma^2)*T + sigma*sqrt(T)*Z)
+    # Optimized: S_final = S_det * exp(vol_part * Z)
+    # float32 halves memory traffic; its roundoff (~1e-7) is far below
+    # the Monte Carlo noise (~1e-2 at this sample size).
+    Z = rng.standard_normal(simulations, dtype=np.float32)
+    S_final = S_det * np.exp(vol_part * Z)
+    payoff = np.maximum(S_final - K, 0.0) * discount
+    total_payoff = payoff.sum(dtype=np.float64)
+
     option_price = total_payoff / simulations
     
     print("\n--- Results ---")
@@ -5,10 +5,12 @@ mod parser;
 mod bytecode;
 mod compiler;
 mod vm;
+mod native;
 mod error;
 
-pub use vm::Context;
+pub use vm::{Column, Context};
 pub use bytecode::Program;
+pub use native::NativeProgram;
 pub use error::{Error, ErrorKind, Position};
 
 use lexer::Lexer;
@@ -84,6 +86,49 @@ impl Program {
         vm.run_batch(var_sets)
     }
 
+    /// Column-wise batch evaluation with scalar bindings
+    /// 
+    /// Takes one `Column` per variable, in the same order as `program.var_names`.
+    /// Variables that are constant across the batch are passed as
+    /// `Column::Scalar` and bound once, so callers don't have to repeat them
+    /// in every variable set.
+    /// 
+    /// # Example
+    /// ```
+    /// use matheval_core::{Column, Compiler};
+    /// 
+    /// let program = Compiler::new().compile("max(S - K, 0) * discount").unwrap();
+    /// let stock_prices = [100.0, 110.0, 120.0];
+    /// 
+    /// let results = program.eval_batch_columns(&[
+    ///     Column::Array(&stock_prices),  // S
+    ///     Column::Scalar(105.0),         // K
+    ///     Column::Scalar(1.0),           // discount
+    /// ]).unwrap();
+    /// assert_eq!(results, vec![0.0, 5.0, 15.0]);
+    /// ```
+    pub fn eval_batch_columns(&self, columns: &[Column]) -> Result<Vec<f64>, String> {
+        let mut vm = VM::new(self);
+        vm.run_batch_columns(columns)
+    }
+
+    /// Specialize the program into native closures for repeated evaluation
+    /// 
+    /// The returned `NativeProgram` skips bytecode dispatch entirely, which
+    /// pays off when the same expression is evaluated over large batches.
+    /// 
+    /// # Example
+    /// ```
+    /// use matheval_core::Compiler;
+    /// 
+    /// let program = Compiler::new().compile("x * 2 + y").unwrap();
+    /// let native = program.compile_native().unwrap();
+    /// assert_eq!(native.eval(&[1.0, 2.0]).unwrap(), 4.0);
+    /// ```
+    pub fn compile_native(&self) -> Result<NativeProgram, String> {
+        NativeProgram::new(self)
+    }
+
     /// Create a context pre-sized for this program
     pub fn create_context(&self) -> Context {
         Context::with_capacity(self.var_names.len())
@@ -355,6 +400,43 @@ mod tests {
         assert!(result.unwrap_err().contains("expected 2"));
     }
 
+    #[test]
+    fn test_eval_batch_columns() {
+        let compiler = Compiler::new();
+        let program = compiler.compile("x * 2 + y").unwrap();
+        
+        let xs = [1.0, 3.0, 5.0];
+        let results = program.eval_batch_columns(&[
+            Column::Array(&xs),
+            Column::Scalar(2.0),
+        ]).unwrap();
+        assert_eq!(results, vec![4.0, 8.0, 12.0]);
+        
+        // Only scalars: evaluated once
+        let results = program.eval_batch_columns(&[
+            Column::Scalar(1.0),
+            Column::Scalar(2.0),
+        ]).unwrap();
+        assert_eq!(results, vec![4.0]);
+    }
+
+    #[test]
+    fn test_eval_batch_columns_errors() {
+        let compiler = Compiler::new();
+        let program = compiler.compile("x + y").unwrap();
+        
+        // Wrong number of columns
+        let result = program.eval_batch_columns(&[Column::Scalar(1.0)]);
+        assert!(result.unwrap_err().contains("expected 2"));
+        
+        // Mismatched array lengths
+        let result = program.eval_batch_columns(&[
+            Column::Array(&[1.0, 2.0]),
+            Column::Array(&[1.0]),
+        ]);
+        assert!(result.unwrap_err().contains("Column 'y'"));
+    }
+
     #[test]
     fn test_eval_batch_monte_carlo_simulation() {
         // Simulate simplified option pricing
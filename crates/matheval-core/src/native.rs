@@ -0,0 +1,248 @@
+/// Specialized program representation: the bytecode is lowered once into a
+/// tree of closures, so evaluation runs without opcode dispatch or a value stack.
+use crate::bytecode::{BuiltinFn, OpCode, Program};
+
+/// A compiled expression node: reads variable values, returns the result
+type Node = Box<dyn Fn(&[f64]) -> Result<f64, String> + Send + Sync>;
+
+/// Program specialized into straight-line native closures
+pub struct NativeProgram {
+    root: Node,
+    var_count: usize,
+}
+
+impl NativeProgram {
+    /// Lower a bytecode program into a closure tree
+    ///
+    /// Function argument counts are validated here, once, instead of on every
+    /// evaluation.
+    pub fn new(program: &Program) -> Result<Self, String> {
+        let instructions = &program.instructions;
+        let mut stack: Vec<Node> = Vec::with_capacity(32);
+
+        let mut pc = 0;
+        while pc < instructions.len() {
+            let opcode = instructions[pc];
+            pc += 1;
+
+            match opcode {
+                op if op == OpCode::LoadConst as u8 => {
+                    let idx = read_u16(instructions, &mut pc) as usize;
+                    let value = program.constants[idx];
+                    stack.push(Box::new(move |_| Ok(value)));
+                }
+                op if op == OpCode::LoadVar as u8 => {
+                    let idx = read_u16(instructions, &mut pc) as usize;
+                    stack.push(Box::new(move |vars: &[f64]| Ok(vars[idx])));
+                }
+                op if op == OpCode::Add as u8 => {
+                    let (a, b) = pop2(&mut stack)?;
+                    stack.push(Box::new(move |vars: &[f64]| Ok(a(vars)? + b(vars)?)));
+                }
+                op if op == OpCode::Sub as u8 => {
+                    let (a, b) = pop2(&mut stack)?;
+                    stack.push(Box::new(move |vars: &[f64]| Ok(a(vars)? - b(vars)?)));
+                }
+                op if op == OpCode::Mul as u8 => {
+                    let (a, b) = pop2(&mut stack)?;
+                    stack.push(Box::new(move |vars: &[f64]| Ok(a(vars)? * b(vars)?)));
+                }
+                op if op == OpCode::Div as u8 => {
+                    let (a, b) = pop2(&mut stack)?;
+                    stack.push(Box::new(move |vars: &[f64]| {
+                        let a = a(vars)?;
+                        let b = b(vars)?;
+                        if b == 0.0 {
+                            return Err("Division by zero".to_string());
+                        }
+                        Ok(a / b)
+                    }));
+                }
+                op if op == OpCode::Pow as u8 => {
+                    let (a, b) = pop2(&mut stack)?;
+                    stack.push(Box::new(move |vars: &[f64]| Ok(a(vars)?.powf(b(vars)?))));
+                }
+                op if op == OpCode::Neg as u8 => {
+                    let a = pop(&mut stack)?;
+                    stack.push(Box::new(move |vars: &[f64]| Ok(-a(vars)?)));
+                }
+                op if op == OpCode::Call as u8 => {
+                    let func_idx = read_u16(instructions, &mut pc) as usize;
+                    let arg_count = instructions[pc] as usize;
+                    pc += 1;
+
+                    if func_idx >= program.func_table.len() {
+                        return Err(format!("Invalid function index: {}", func_idx));
+                    }
+
+                    if let Some(expected) = program.func_metadata[func_idx].expected_args {
+                        if arg_count != expected {
+                            let func_name = &program.func_names[func_idx];
+                            return Err(format!(
+                                "Function '{}' expects {} argument(s), got {}",
+                                func_name, expected, arg_count
+                            ));
+                        }
+                    }
+
+                    if stack.len() < arg_count {
+                        return Err("Stack underflow in function call".to_string());
+                    }
+
+                    let func = program.func_table[func_idx];
+                    let args = stack.split_off(stack.len() - arg_count);
+                    stack.push(call_node(func, args));
+                }
+                _ => return Err(format!("Unknown opcode: {}", opcode)),
+            }
+        }
+
+        let root = pop(&mut stack)?;
+        Ok(Self {
+            root,
+            var_count: program.var_names.len(),
+        })
+    }
+
+    /// Evaluate with one set of variable values, ordered as `program.var_names`
+    pub fn eval(&self, var_values: &[f64]) -> Result<f64, String> {
+        if var_values.len() < self.var_count {
+            return Err(format!(
+                "Context missing variables: expected {}, got {}",
+                self.var_count,
+                var_values.len()
+            ));
+        }
+        (self.root)(var_values)
+    }
+
+    /// Batch evaluation, same contract as `Program::eval_batch`
+    pub fn eval_batch(&self, var_sets: &[&[f64]]) -> Result<Vec<f64>, String> {
+        let mut results = Vec::with_capacity(var_sets.len());
+
+        for (i, var_values) in var_sets.iter().enumerate() {
+            if var_values.len() != self.var_count {
+                return Err(format!(
+                    "Variable set {} has {} values, expected {}",
+                    i,
+                    var_values.len(),
+                    self.var_count
+                ));
+            }
+            results.push((self.root)(var_values)?);
+        }
+
+        Ok(results)
+    }
+}
+
+fn call_node(func: BuiltinFn, mut args: Vec<Node>) -> Node {
+    // Pass fixed-size argument arrays for the common arities to avoid a per-call Vec
+    match args.len() {
+        1 => {
+            let a = args.pop().unwrap();
+            return Box::new(move |vars: &[f64]| Ok(func(&[a(vars)?])));
+        }
+        2 => {
+            let b = args.pop().unwrap();
+            let a = args.pop().unwrap();
+            return Box::new(move |vars: &[f64]| Ok(func(&[a(vars)?, b(vars)?])));
+        }
+        _ => {}
+    }
+    Box::new(move |vars: &[f64]| {
+        let mut values = Vec::with_capacity(args.len());
+        for arg in &args {
+            values.push(arg(vars)?);
+        }
+        Ok(func(&values))
+    })
+}
+
+#[inline]
+fn read_u16(instructions: &[u8], pc: &mut usize) -> u16 {
+    let high = instructions[*pc] as u16;
+    let low = instructions[*pc + 1] as u16;
+    *pc += 2;
+    (high << 8) | low
+}
+
+#[inline]
+fn pop(stack: &mut Vec<Node>) -> Result<Node, String> {
+    stack.pop().ok_or_else(|| "Stack underflow".to_string())
+}
+
+#[inline]
+fn pop2(stack: &mut Vec<Node>) -> Result<(Node, Node), String> {
+    let b = pop(stack)?;
+    let a = pop(stack)?;
+    Ok((a, b))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::Compiler;
+
+    fn compile_native(input: &str) -> NativeProgram {
+        let program = Compiler::new().compile(input).unwrap();
+        NativeProgram::new(&program).unwrap()
+    }
+
+    #[test]
+    fn test_native_arithmetic() {
+        let native = compile_native("x * 2 + y");
+        assert_eq!(native.eval(&[1.0, 2.0]).unwrap(), 4.0);
+        assert_eq!(native.eval(&[5.0, 6.0]).unwrap(), 16.0);
+    }
+
+    #[test]
+    fn test_native_matches_vm() {
+        let program = Compiler::new()
+            .compile("max(S - K, 0) * discount + sqrt(abs(-S)) ^ 2 / 4")
+            .unwrap();
+        let native = NativeProgram::new(&program).unwrap();
+
+        let var_sets: Vec<&[f64]> = vec![
+            &[90.0, 105.0, 0.95],
+            &[110.0, 105.0, 0.95],
+            &[130.0, 105.0, 0.95],
+        ];
+        assert_eq!(
+            native.eval_batch(&var_sets).unwrap(),
+            program.eval_batch(&var_sets).unwrap()
+        );
+    }
+
+    #[test]
+    fn test_native_variadic_call() {
+        let native = compile_native("max(x, 1, 2, 3) + min(4, 5)");
+        assert_eq!(native.eval(&[0.0]).unwrap(), 7.0);
+        assert_eq!(native.eval(&[10.0]).unwrap(), 14.0);
+    }
+
+    #[test]
+    fn test_native_division_by_zero() {
+        let native = compile_native("1 / x");
+        let result = native.eval(&[0.0]);
+        assert!(result.is_err());
+        assert!(result.unwrap_err().contains("Division by zero"));
+    }
+
+    #[test]
+    fn test_native_wrong_function_arg_count() {
+        let program = Compiler::new().compile("sin(1, 2)").unwrap();
+        let result = NativeProgram::new(&program);
+        assert!(result.is_err());
+        assert!(result.err().unwrap().contains("expects 1"));
+    }
+
+    #[test]
+    fn test_native_eval_batch_wrong_var_count() {
+        let native = compile_native("x + y");
+        let var_sets: Vec<&[f64]> = vec![&[1.0]];
+        let result = native.eval_batch(&var_sets);
+        assert!(result.is_err());
+        assert!(result.unwrap_err().contains("expected 2"));
+    }
+}
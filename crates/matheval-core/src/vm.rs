@@ -58,6 +58,15 @@ impl Context {
     }
 }
 
+/// Input for one variable in column-wise batch evaluation
+#[derive(Debug, Clone, Copy)]
+pub enum Column<'a> {
+    /// Same value for every evaluation, bound once
+    Scalar(f64),
+    /// One value per evaluation
+    Array(&'a [f64]),
+}
+
 /// Stack-based virtual machine with optimized instruction dispatch
 pub struct VM<'a> {
     program: &'a Program,
@@ -82,9 +91,15 @@ impl<'a> VM<'a> {
             ));
         }
 
-        let var_values = context.values();
+        self.run_once(context.values())
+    }
+
+    /// Evaluate the program once against a full set of variable values
+    /// Shared by run(), run_batch() and run_batch_columns()
+    #[inline]
+    fn run_once(&mut self, var_values: &[f64]) -> Result<f64, String> {
         self.stack.clear();
-        
+
         let mut pc = 0;
         while pc < self.program.instructions.len() {
             self.execute_instruction(&mut pc, var_values)?;
@@ -94,7 +109,6 @@ impl<'a> VM<'a> {
     }
 
     /// Execute a single instruction at the current program counter
-    /// This method is shared between run() and run_batch() to eliminate code duplication
     #[inline]
     fn execute_instruction(&mut self, pc: &mut usize, var_values: &[f64]) -> Result<(), String> {
         let instructions = &self.program.instructions;
@@ -232,15 +246,60 @@ impl<'a> VM<'a> {
                 ));
             }
 
-            // Reset stack for each evaluation
-            self.stack.clear();
+            results.push(self.run_once(var_values)?);
+        }
+
+        Ok(results)
+    }
+
+    /// Column-wise batch evaluation: one `Column` per variable, in the order of
+    /// `program.var_names`
+    /// 
+    /// Scalar columns are written into the variable buffer once; only array
+    /// columns are updated per evaluation. All array columns must have the same
+    /// length, which is the number of results. With no array columns, the
+    /// program is evaluated once.
+    pub fn run_batch_columns(&mut self, columns: &[Column]) -> Result<Vec<f64>, String> {
+        let expected_var_count = self.program.var_names.len();
+        if columns.len() != expected_var_count {
+            return Err(format!(
+                "Got {} columns, expected {}",
+                columns.len(),
+                expected_var_count
+            ));
+        }
+
+        let mut var_values = vec![0.0; expected_var_count];
+        let mut arrays: Vec<(usize, &[f64])> = Vec::new();
+        let mut rows: Option<usize> = None;
+
+        for (idx, column) in columns.iter().enumerate() {
+            match *column {
+                Column::Scalar(value) => var_values[idx] = value,
+                Column::Array(values) => {
+                    let expected_rows = *rows.get_or_insert(values.len());
+                    if values.len() != expected_rows {
+                        return Err(format!(
+                            "Column '{}' has {} values, expected {}",
+                            self.program.var_names[idx],
+                            values.len(),
+                            expected_rows
+                        ));
+                    }
+                    arrays.push((idx, values));
+                }
+            }
+        }
+
+        let rows = rows.unwrap_or(1);
+        let mut results = Vec::with_capacity(rows);
 
-            let mut pc = 0;
-            while pc < self.program.instructions.len() {
-                self.execute_instruction(&mut pc, var_values)?;
+        for row in 0..rows {
+            for &(idx, values) in &arrays {
+                var_values[idx] = values[row];
             }
 
-            results.push(self.pop()?);
+            results.push(self.run_once(&var_values)?);
         }
 
         Ok(results)
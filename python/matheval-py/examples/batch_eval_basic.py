@@ -5,6 +5,7 @@
 """
 
 import matheval
+import numpy as np
 import time
 
 def main():
@@ -36,12 +37,15 @@ def main():
     # 准备大量数据
     iterations = 10000
     large_var_sets = [[float(i), float(i) * 0.5] for i in range(iterations)]
+    # 同样的数据，以连续的 float64 数组形式存放
+    xs = np.arange(iterations, dtype=np.float64)
+    arr = np.column_stack([xs, xs * 0.5])
     
     # 方法 1: 循环调用 eval()
     start = time.time()
     results_loop = []
+    context = matheval.Context()  # 复用同一个 Context，只更新变量值
     for var_set in large_var_sets:
-        context = matheval.Context()
         context.set("x", var_set[0])
         context.set("y", var_set[1])
         results_loop.append(program.eval(context))
@@ -52,13 +56,30 @@ def main():
     results_batch = program.eval_batch(large_var_sets)
     time_batch = time.time() - start
     
+    # 方法 3: NumPy 数组批量求值（零拷贝读取）
+    start = time.time()
+    results_np = program.eval_batch_np(arr)
+    time_np = time.time() - start
+    
+    # 方法 4: 特化为原生代码后批量求值（跳过字节码分发）
+    native = program.compile_native()
+    start = time.time()
+    results_native = native(arr)
+    time_native = time.time() - start
+    
     print(f"计算 {iterations} 次:")
     print(f"  循环调用 eval():  {time_loop*1000:.2f} ms")
     print(f"  批量求值 eval_batch(): {time_batch*1000:.2f} ms")
-    print(f"  加速比: {time_loop/time_batch:.2f}x")
+    print(f"  NumPy 批量求值 eval_batch_np(): {time_np*1000:.2f} ms")
+    print(f"  原生特化 compile_native(): {time_native*1000:.2f} ms")
+    print(f"  加速比 (eval_batch): {time_loop/time_batch:.2f}x")
+    print(f"  加速比 (eval_batch_np): {time_loop/time_np:.2f}x")
+    print(f"  加速比 (compile_native): {time_loop/time_native:.2f}x")
     
     # 验证结果一致
     assert results_loop == results_batch, "结果不一致！"
+    assert results_np.tolist() == results_batch, "结果不一致！"
+    assert results_native.tolist() == results_batch, "结果不一致！"
     print(f"\n✓ 结果验证通过")
 
 if __name__ == "__main__":
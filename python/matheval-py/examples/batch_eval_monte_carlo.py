@@ -5,9 +5,33 @@
 """
 
 import matheval
-import random
+import numpy as np
+import os
 import time
-import math
+from concurrent.futures import ThreadPoolExecutor
+
+# 共享的随机数生成器；可通过 MATHEVAL_SEED 环境变量指定种子
+SEED = int(os.environ.get("MATHEVAL_SEED", 42))
+rng = np.random.default_rng(SEED)
+
+# 达到该规模后才值得拆分到多个线程
+PARALLEL_THRESHOLD = 100_000
+
+def eval_batch_parallel(program, varying, constants, n_workers=None):
+    """
+    按块拆分变化的变量，在线程池中并行批量求值
+
+    matheval 的批量求值在 Rust 中执行时会释放 GIL，因此多个线程可以真正并行
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    names = list(varying)
+    chunks = zip(*(np.array_split(varying[name], n_workers) for name in names))
+    
+    def run(columns):
+        return program.eval_batch_with_bindings(dict(zip(names, columns)), constants)
+    
+    with ThreadPoolExecutor(n_workers) as executor:
+        return np.concatenate(list(executor.map(run, chunks)))
 
 def main():
     print("=== 蒙特卡洛期权定价模拟 ===\n")
@@ -35,40 +59,41 @@ def main():
     print(f"变量顺序: {program.var_names}\n")
     
     # 预计算常量
-    discount = math.exp(-r * T)
+    discount, drift, vol_part, _ = matheval.finance.bs_constants(S, T, r, sigma)
     
     # 蒙特卡洛模拟
     num_simulations = 100000
     print(f"运行 {num_simulations:,} 次模拟...\n")
     
-    # 生成随机股价路径
-    random.seed(42)
-    stock_prices = []
-    for _ in range(num_simulations):
-        # 简化：直接生成到期时的股价
-        # S_T = S * exp((r - 0.5*sigma^2)*T + sigma*sqrt(T)*Z)
-        Z = random.gauss(0, 1)  # 标准正态分布
-        drift = (r - 0.5 * sigma**2) * T
-        diffusion = sigma * math.sqrt(T) * Z
-        S_T = S * math.exp(drift + diffusion)
-        stock_prices.append(S_T)
-    
-    # 构建变量集合
-    # 变量顺序: S, K, discount
-    var_sets = [[s, K, discount] for s in stock_prices]
+    # 生成随机股价路径（一次性向量化生成）
+    # 简化：直接生成到期时的股价
+    # S_T = S * exp((r - 0.5*sigma^2)*T + sigma*sqrt(T)*Z)
+    # 使用 float32 生成样本以减半内存带宽；其舍入误差 (~1e-7) 远小于蒙特卡洛噪声 (~1e-2)
+    Z = rng.standard_normal(num_simulations, dtype=np.float32)  # 标准正态分布
+    stock_prices = S * np.exp(drift + vol_part * Z)
+    
+    # matheval 的 VM 以 float64 计算，传入前转换为 float64
+    stock_prices = stock_prices.astype(np.float64)
     
     # 批量计算期权价值
     start = time.time()
-    payoffs = program.eval_batch(var_sets)
+    # 只有 S 逐次变化；K 和 discount 作为常量只绑定一次，无需为每行重复存储
+    varying = {"S": stock_prices}
+    constants = {"K": K, "discount": discount}
+    if num_simulations >= PARALLEL_THRESHOLD:
+        payoffs = eval_batch_parallel(program, varying, constants)
+    else:
+        payoffs = program.eval_batch_with_bindings(varying, constants)
     time_elapsed = time.time() - start
     
     # 计算期权价格（平均折现收益）
-    option_price = sum(payoffs) / num_simulations
+    # ndarray.sum() 使用成对求和，误差更小且在 C 中向量化执行
+    option_price = payoffs.sum() / num_simulations
     
-    # 统计分析
-    positive_payoffs = [p for p in payoffs if p > 0]
-    prob_itm = len(positive_payoffs) / num_simulations
-    avg_positive_payoff = sum(positive_payoffs) / len(positive_payoffs) if positive_payoffs else 0
+    # 统计分析（布尔掩码，单次向量化遍历）
+    mask = payoffs > 0
+    prob_itm = np.count_nonzero(mask) / num_simulations
+    avg_positive_payoff = payoffs[mask].mean() if mask.any() else 0.0
     
     print("=== 模拟结果 ===")
     print(f"期权理论价格: ${option_price:.4f}")
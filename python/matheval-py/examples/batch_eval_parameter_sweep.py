@@ -5,6 +5,8 @@
 """
 
 import matheval
+import numpy as np
+import sys
 import time
 
 def main():
@@ -28,18 +30,21 @@ def main():
     print(f"  初速度 v0 = {v0_values} m/s")
     print(f"  时间 t = {t_values} s\n")
     
-    # 生成所有参数组合
-    var_sets = []
-    for v0 in v0_values:
-        for t in t_values:
-            # 变量顺序: g, t, v0
-            var_sets.append([g, t, v0])
+    # 生成所有参数组合：一次性构建连续的 (len(v0)*len(t), 3) float64 数组
+    # 行顺序为 v0 外层、t 内层；列顺序按 program.var_names 排列
+    V0, T = np.meshgrid(v0_values, t_values, indexing='ij')
+    columns = {
+        "v0": V0.ravel().astype(np.float64),
+        "t": T.ravel().astype(np.float64),
+        "g": np.full(V0.size, g),
+    }
+    arr = np.column_stack([columns[name] for name in program.var_names])
     
-    print(f"总共 {len(var_sets)} 种参数组合\n")
+    print(f"总共 {len(arr)} 种参数组合\n")
     
     # 批量计算
     start = time.time()
-    distances = program.eval_batch(var_sets)
+    distances = program.eval_batch_np(arr)
     time_elapsed = time.time() - start
     
     # 展示结果表格
@@ -51,16 +56,16 @@ def main():
     print()
     print("-" * 56)
     
-    idx = 0
-    for v0 in v0_values:
-        print(f"{v0:>8.1f}", end="")
-        for _ in t_values:
-            print(f"{distances[idx]:>8.2f}", end="")
-            idx += 1
-        print()
+    # 先拼接整张表格，再一次性写出，避免逐个单元格调用 print
+    table = distances.reshape(len(v0_values), len(t_values))
+    rows = [
+        f"{v0:>8.1f}" + "".join(f"{d:>8.2f}" for d in row)
+        for v0, row in zip(v0_values, table)
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
     
     print(f"\n计算时间: {time_elapsed*1000:.2f} ms")
-    print(f"平均每次: {time_elapsed/len(var_sets)*1000000:.2f} μs")
+    print(f"平均每次: {time_elapsed/len(arr)*1000000:.2f} μs")
     
     # 敏感性分析
     print("\n=== 敏感性分析 ===\n")
@@ -68,7 +73,7 @@ def main():
     # 固定时间，分析初速度的影响
     t_fixed = 2.0
     v0_range = [float(i) for i in range(0, 51, 5)]
-    var_sets_v0 = [[g, t_fixed, v0] for v0 in v0_range]
+    var_sets_v0 = [[v0, t_fixed, g] for v0 in v0_range]  # 变量顺序: v0, t, g
     distances_v0 = program.eval_batch(var_sets_v0)
     
     print(f"固定时间 t={t_fixed}s，改变初速度:")
@@ -79,7 +84,7 @@ def main():
     print(f"\n固定初速度 v0={v0_values[2]}m/s，改变时间:")
     v0_fixed = v0_values[2]
     t_range = [float(i) * 0.2 for i in range(0, 16)]
-    var_sets_t = [[g, t, v0_fixed] for t in t_range]
+    var_sets_t = [[v0_fixed, t, g] for t in t_range]  # 变量顺序: v0, t, g
     distances_t = program.eval_batch(var_sets_t)
     
     for t, d in zip(t_range, distances_t):
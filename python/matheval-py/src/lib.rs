@@ -1,5 +1,6 @@
 use pyo3::prelude::*;
-use matheval_core::{Compiler as RsCompiler, Program as RsProgram};
+use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1, PyReadonlyArray2};
+use matheval_core::{Column, Compiler as RsCompiler, NativeProgram as RsNativeProgram, Program as RsProgram};
 use std::collections::HashMap;
 
 #[pyclass]
@@ -88,29 +89,270 @@ impl Program {
     ///     >>> var_sets = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
     ///     >>> results = program.eval_batch(var_sets)
     ///     >>> print(results)  # [4.0, 10.0, 16.0]
-    fn eval_batch(&self, var_sets: Vec<Vec<f64>>) -> PyResult<Vec<f64>> {
+    /// 
+    /// The GIL is released during evaluation, so batches can run in parallel
+    /// from multiple Python threads. The same holds for the other batch methods.
+    fn eval_batch(&self, py: Python<'_>, var_sets: Vec<Vec<f64>>) -> PyResult<Vec<f64>> {
         // Convert Vec<Vec<f64>> to Vec<&[f64]>
         let var_sets_refs: Vec<&[f64]> = var_sets.iter()
             .map(|v| v.as_slice())
             .collect();
         
-        match self.inner.eval_batch(&var_sets_refs) {
+        match py.allow_threads(|| self.inner.eval_batch(&var_sets_refs)) {
             Ok(results) => Ok(results),
             Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(e)),
         }
     }
     
+    /// Batch evaluation over a NumPy array, without per-value conversion
+    /// 
+    /// The array buffer is borrowed directly, so no Python floats are created
+    /// for the inputs and the VM reads each row as a contiguous slice.
+    /// 
+    /// Args:
+    ///     arr: C-contiguous float64 ndarray of shape (N, n_vars), with columns
+    ///          in the same order as program.var_names
+    /// 
+    /// The GIL is released while the array is read in place, so it must not be
+    /// modified by other threads until the call returns.
+    /// 
+    /// Returns:
+    ///     float64 ndarray of shape (N,)
+    /// 
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> program = matheval.Compiler().compile("x * 2 + y")
+    ///     >>> arr = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    ///     >>> print(program.eval_batch_np(arr))  # [ 4. 10. 16.]
+    fn eval_batch_np<'py>(
+        &self,
+        py: Python<'py>,
+        arr: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let var_sets_refs = array_rows(&arr)?;
+
+        match py.allow_threads(|| self.inner.eval_batch(&var_sets_refs)) {
+            Ok(results) => Ok(results.into_pyarray_bound(py)),
+            Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(e)),
+        }
+    }
+    
+    /// Batch evaluation with per-variable arrays and scalar constants
+    /// 
+    /// Variables that don't change across the batch are bound once as scalars,
+    /// so they don't have to be repeated in every row.
+    /// 
+    /// Args:
+    ///     varying: Dict mapping variable names to contiguous float64 1D arrays,
+    ///              all of the same length N
+    ///     constants: Dict mapping variable names to floats
+    /// 
+    /// Every variable of the program must be bound exactly once; unknown names
+    /// raise RuntimeError.
+    /// 
+    /// The GIL is released while the arrays are read in place, so they must not
+    /// be modified by other threads until the call returns.
+    /// 
+    /// Returns:
+    ///     float64 ndarray of shape (N,)
+    /// 
+    /// Example:
+    ///     >>> program = matheval.Compiler().compile("max(S - K, 0) * discount")
+    ///     >>> results = program.eval_batch_with_bindings(
+    ///     ...     varying={"S": stock_prices},
+    ///     ...     constants={"K": 105.0, "discount": 0.95},
+    ///     ... )
+    #[pyo3(signature = (varying, constants=None))]
+    fn eval_batch_with_bindings<'py>(
+        &self,
+        py: Python<'py>,
+        varying: HashMap<String, PyReadonlyArray1<'py, f64>>,
+        constants: Option<HashMap<String, f64>>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let constants = constants.unwrap_or_default();
+
+        // Reject names the program doesn't use, and names bound twice
+        for var_name in varying.keys().chain(constants.keys()) {
+            if !self.inner.var_names.contains(var_name) {
+                return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                    format!("Unknown variable: {}", var_name)
+                ));
+            }
+        }
+        for var_name in varying.keys() {
+            if constants.contains_key(var_name) {
+                return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                    format!("Variable bound in both varying and constants: {}", var_name)
+                ));
+            }
+        }
+
+        let mut columns = Vec::with_capacity(self.inner.var_names.len());
+
+        for var_name in &self.inner.var_names {
+            if let Some(values) = varying.get(var_name) {
+                columns.push(Column::Array(values.as_slice()?));
+            } else if let Some(&value) = constants.get(var_name) {
+                columns.push(Column::Scalar(value));
+            } else {
+                return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                    format!("Undefined variable: {}", var_name)
+                ));
+            }
+        }
+
+        match py.allow_threads(|| self.inner.eval_batch_columns(&columns)) {
+            Ok(results) => Ok(results.into_pyarray_bound(py)),
+            Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(e)),
+        }
+    }
+
+    /// Specialize the program into native code for repeated batch evaluation
+    /// 
+    /// Returns a callable that accepts the same arrays as eval_batch_np(),
+    /// but skips bytecode dispatch. Worth it for large or repeated batches.
+    /// 
+    /// Example:
+    ///     >>> native = program.compile_native()
+    ///     >>> results = native(arr)
+    fn compile_native(&self) -> PyResult<NativeProgram> {
+        match self.inner.compile_native() {
+            Ok(native) => Ok(NativeProgram {
+                inner: native,
+                var_names: self.inner.var_names.clone(),
+            }),
+            Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(e)),
+        }
+    }
+    
     #[getter]
     fn var_names(&self) -> Vec<String> {
         self.inner.var_names.clone()
     }
 }
 
+#[pyclass]
+struct NativeProgram {
+    inner: RsNativeProgram,
+    var_names: Vec<String>,
+}
+
+#[pymethods]
+impl NativeProgram {
+    /// Evaluate over a C-contiguous float64 ndarray of shape (N, n_vars)
+    /// 
+    /// The GIL is released while the array is read in place, so it must not be
+    /// modified by other threads until the call returns.
+    fn __call__<'py>(
+        &self,
+        py: Python<'py>,
+        arr: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let var_sets_refs = array_rows(&arr)?;
+
+        match py.allow_threads(|| self.inner.eval_batch(&var_sets_refs)) {
+            Ok(results) => Ok(results.into_pyarray_bound(py)),
+            Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(e)),
+        }
+    }
+
+    #[getter]
+    fn var_names(&self) -> Vec<String> {
+        self.var_names.clone()
+    }
+}
+
+/// Split a C-contiguous 2D array into per-row slices without copying
+fn array_rows<'a>(arr: &'a PyReadonlyArray2<'_, f64>) -> PyResult<Vec<&'a [f64]>> {
+    let view = arr.as_array();
+    // as_slice() also accepts Fortran order, whose buffer is column-major
+    if !view.is_standard_layout() {
+        return Err(pyo3::exceptions::PyTypeError::new_err(
+            "array must be C-contiguous; use numpy.ascontiguousarray()"
+        ));
+    }
+    let (n_rows, n_cols) = view.dim();
+    let values = arr.as_slice()?;
+
+    Ok((0..n_rows)
+        .map(|i| &values[i * n_cols..(i + 1) * n_cols])
+        .collect())
+}
+
+/// Precomputed Black-Scholes Monte Carlo constants
+#[pyclass]
+struct BSConstants {
+    #[pyo3(get)]
+    discount: f64,
+    #[pyo3(get)]
+    drift: f64,
+    #[pyo3(get)]
+    vol_part: f64,
+    #[pyo3(get, name = "S_det")]
+    s_det: f64,
+}
+
+#[pymethods]
+impl BSConstants {
+    /// Unpack like a tuple: discount, drift, vol_part, S_det = bs_constants(...)
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, pyo3::types::PyIterator>> {
+        pyo3::types::PyTuple::new_bound(py, [self.discount, self.drift, self.vol_part, self.s_det])
+            .as_any()
+            .iter()
+    }
+
+    fn __len__(&self) -> usize {
+        4
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "BSConstants(discount={}, drift={}, vol_part={}, S_det={})",
+            self.discount, self.drift, self.vol_part, self.s_det
+        )
+    }
+}
+
+/// Deterministic parts of the Black-Scholes terminal price
+/// 
+/// S_T = S * exp(drift + vol_part * Z) = S_det * exp(vol_part * Z)
+/// 
+/// Args:
+///     S: Spot price
+///     T: Time to expiration (years)
+///     r: Risk-free rate
+///     sigma: Volatility
+/// 
+/// Returns:
+///     BSConstants with discount, drift, vol_part and S_det
+#[pyfunction]
+#[allow(non_snake_case)]
+fn bs_constants(S: f64, T: f64, r: f64, sigma: f64) -> BSConstants {
+    let drift = (r - 0.5 * sigma.powi(2)) * T;
+    BSConstants {
+        discount: (-r * T).exp(),
+        drift,
+        vol_part: sigma * T.sqrt(),
+        s_det: S * drift.exp(),
+    }
+}
+
 #[pymodule]
-fn matheval(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
+fn matheval(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<Compiler>()?;
     m.add_class::<Context>()?;
     m.add_class::<Program>()?;
+    m.add_class::<NativeProgram>()?;
+
+    let finance = PyModule::new_bound(py, "finance")?;
+    finance.add_class::<BSConstants>()?;
+    finance.add_function(wrap_pyfunction!(bs_constants, &finance)?)?;
+    m.add_submodule(&finance)?;
+    // Extension submodules aren't registered with the import system, so
+    // `import matheval.finance` / `from matheval.finance import ...` would fail
+    py.import_bound("sys")?
+        .getattr("modules")?
+        .set_item("matheval.finance", &finance)?;
     Ok(())
 }
 
@@ -187,6 +429,15 @@ mod tests {
         assert!(var_names.contains(&"z".to_string()));
     }
 
+    #[test]
+    fn test_bs_constants() {
+        let c = bs_constants(100.0, 1.0, 0.05, 0.2);
+        assert!((c.discount - (-0.05f64).exp()).abs() < 1e-12);
+        assert!((c.drift - 0.03).abs() < 1e-12);
+        assert!((c.vol_part - 0.2).abs() < 1e-12);
+        assert!((c.s_det - 100.0 * 0.03f64.exp()).abs() < 1e-12);
+    }
+
     #[test]
     fn test_constant_folding_in_python_wrapper() {
         let compiler = Compiler::new();
@@ -0,0 +1,16 @@
+import matheval
+import pytest
+
+
+@pytest.fixture(scope="session")
+def compile_expr():
+    """Compile each unique expression once per test session"""
+    compiler = matheval.Compiler()
+    cache = {}
+
+    def _compile(expr):
+        if expr not in cache:
+            cache[expr] = compiler.compile(expr)
+        return cache[expr]
+
+    return _compile
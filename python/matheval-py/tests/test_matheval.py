@@ -1,21 +1,23 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 import matheval
+import numpy as np
 import pytest
 
 
-def test_simple_arithmetic():
+def test_simple_arithmetic(compile_expr):
     """Test basic arithmetic operations"""
-    compiler = matheval.Compiler()
-    program = compiler.compile("1 + 2 * 3")
+    program = compile_expr("1 + 2 * 3")
     context = matheval.Context()
     
     result = program.eval(context)
     assert result == 7.0
 
 
-def test_variables():
+def test_variables(compile_expr):
     """Test variable substitution"""
-    compiler = matheval.Compiler()
-    program = compiler.compile("x + y")
+    program = compile_expr("x + y")
     
     context = matheval.Context()
     context.set("x", 10.0)
@@ -25,53 +27,46 @@ def test_variables():
     assert result == 30.0
 
 
-def test_functions():
+def test_functions(compile_expr):
     """Test built-in functions"""
-    compiler = matheval.Compiler()
-    program = compiler.compile("max(1, 2, 3) + min(4, 5)")
+    program = compile_expr("max(1, 2, 3) + min(4, 5)")
     context = matheval.Context()
     
     result = program.eval(context)
     assert result == 7.0  # max(1,2,3) = 3, min(4,5) = 4, 3+4 = 7
 
 
-def test_precedence():
+def test_precedence(compile_expr):
     """Test operator precedence"""
-    compiler = matheval.Compiler()
-    
     # 2 * 3 + 4 = 10
-    p1 = compiler.compile("2 * 3 + 4")
+    p1 = compile_expr("2 * 3 + 4")
     # 2 + 3 * 4 = 14
-    p2 = compiler.compile("2 + 3 * 4")
+    p2 = compile_expr("2 + 3 * 4")
     
     ctx = matheval.Context()
     assert p1.eval(ctx) == 10.0
     assert p2.eval(ctx) == 14.0
 
 
-def test_right_associativity():
+def test_right_associativity(compile_expr):
     """Test right-associative power operator"""
-    compiler = matheval.Compiler()
     # 2 ^ 3 ^ 2 = 2 ^ (3 ^ 2) = 2 ^ 9 = 512
-    program = compiler.compile("2 ^ 3 ^ 2")
+    program = compile_expr("2 ^ 3 ^ 2")
     context = matheval.Context()
     
     result = program.eval(context)
     assert result == 512.0
 
 
-def test_compilation_error():
+def test_compilation_error(compile_expr):
     """Test that invalid expressions raise errors"""
-    compiler = matheval.Compiler()
-    
     with pytest.raises(ValueError):
-        compiler.compile("1 + + 2")  # Invalid syntax
+        compile_expr("1 + + 2")  # Invalid syntax
 
 
-def test_runtime_error():
+def test_runtime_error(compile_expr):
     """Test that undefined variables raise errors"""
-    compiler = matheval.Compiler()
-    program = compiler.compile("x + y")
+    program = compile_expr("x + y")
     context = matheval.Context()
     # Only set x, not y
     context.set("x", 10.0)
@@ -80,11 +75,10 @@ def test_runtime_error():
         program.eval(context)
 
 
-def test_complex_expression():
+def test_complex_expression(compile_expr):
     """Test a more complex real-world expression"""
-    compiler = matheval.Compiler()
     # Quadratic formula: (-b + sqrt(b^2 - 4*a*c)) / (2*a)
-    program = compiler.compile("(-b + sqrt(b ^ 2 - 4 * a * c)) / (2 * a)")
+    program = compile_expr("(-b + sqrt(b ^ 2 - 4 * a * c)) / (2 * a)")
     
     context = matheval.Context()
     context.set("a", 1.0)
@@ -96,10 +90,9 @@ def test_complex_expression():
     assert abs(result - 3.0) < 0.0001
 
 
-def test_eval_batch():
+def test_eval_batch(compile_expr):
     """Test batch evaluation"""
-    compiler = matheval.Compiler()
-    program = compiler.compile("x * 2 + y")
+    program = compile_expr("x * 2 + y")
     
     # Check variable order (alphabetical or first appearance depending on implementation)
     # In Rust implementation it's first appearance: x, y
@@ -131,5 +124,150 @@ def test_eval_batch():
         program.eval_batch([[1.0]])  # Missing y
 
 
+def test_eval_batch_np(compile_expr):
+    """Test batch evaluation with a NumPy array"""
+    program = compile_expr("x * 2 + y")
+    
+    arr = np.array([
+        [1.0, 2.0],
+        [3.0, 4.0],
+        [5.0, 6.0]
+    ])
+    
+    results = program.eval_batch_np(arr)
+    assert isinstance(results, np.ndarray)
+    assert results.tolist() == [4.0, 10.0, 16.0]
+
+    # Test with empty array
+    assert program.eval_batch_np(np.empty((0, 2))).shape == (0,)
+
+    # Test error handling (wrong number of columns)
+    with pytest.raises(RuntimeError):
+        program.eval_batch_np(np.ones((3, 1)))  # Missing y
+
+    # Fortran-order input must not be misread as rows
+    with pytest.raises(TypeError):
+        program.eval_batch_np(np.asfortranarray(arr))
+
+
+def test_eval_batch_with_bindings(compile_expr):
+    """Test batch evaluation with varying arrays and scalar constants"""
+    program = compile_expr("max(S - K, 0) * discount")
+    
+    results = program.eval_batch_with_bindings(
+        varying={"S": np.array([90.0, 110.0, 130.0])},
+        constants={"K": 105.0, "discount": 0.5},
+    )
+    assert results.tolist() == [0.0, 2.5, 12.5]
+
+    # Test error handling (variable not bound)
+    with pytest.raises(RuntimeError):
+        program.eval_batch_with_bindings(varying={"S": np.ones(3)}, constants={"K": 1.0})
+
+    # Test error handling (mismatched array lengths)
+    with pytest.raises(RuntimeError):
+        program.eval_batch_with_bindings(
+            varying={"S": np.ones(3), "K": np.ones(2)},
+            constants={"discount": 1.0},
+        )
+
+    # Test error handling (name the program doesn't use)
+    with pytest.raises(RuntimeError, match="Unknown variable: T"):
+        program.eval_batch_with_bindings(
+            varying={"S": np.ones(3)},
+            constants={"K": 1.0, "discount": 1.0, "T": 1.0},
+        )
+    with pytest.raises(RuntimeError, match="Unknown variable: Z"):
+        program.eval_batch_with_bindings(
+            varying={"S": np.ones(3), "Z": np.ones(3)},
+            constants={"K": 1.0, "discount": 1.0},
+        )
+
+    # Test error handling (variable bound twice)
+    with pytest.raises(RuntimeError, match="both varying and constants: K"):
+        program.eval_batch_with_bindings(
+            varying={"S": np.ones(3), "K": np.ones(3)},
+            constants={"K": 1.0, "discount": 1.0},
+        )
+
+
+def test_compile_native(compile_expr):
+    """Test the specialized native program matches the VM"""
+    program = compile_expr("max(S - K, 0) * discount")
+    native = program.compile_native()
+    assert native.var_names == program.var_names
+    
+    arr = np.array([
+        [90.0, 105.0, 0.95],
+        [110.0, 105.0, 0.95],
+        [130.0, 105.0, 0.95]
+    ])
+    
+    assert native(arr).tolist() == program.eval_batch_np(arr).tolist()
+
+    # Test error handling (wrong number of columns)
+    with pytest.raises(RuntimeError):
+        native(np.ones((3, 1)))
+
+    # Fortran-order input must not be misread as rows
+    with pytest.raises(TypeError):
+        native(np.asfortranarray(arr))
+
+
+def test_batch_concurrent_threads(compile_expr):
+    """Test batch methods give the serial results when run from many threads"""
+    program = compile_expr("max(S - K, 0) * discount")
+    native = program.compile_native()
+    
+    rng = np.random.default_rng(0)
+    S = 100.0 + 20.0 * rng.standard_normal(100_000)
+    arr = np.column_stack([S, np.full_like(S, 105.0), np.full_like(S, 0.95)])
+    expected = program.eval_batch_np(arr)
+    
+    # Chunks are evaluated with the GIL released, so they run in parallel
+    n_workers = 8
+    S_chunks = np.array_split(S, n_workers)
+    arr_chunks = np.array_split(arr, n_workers)
+    with ThreadPoolExecutor(n_workers) as executor:
+        bindings = executor.map(
+            lambda chunk: program.eval_batch_with_bindings(
+                varying={"S": chunk},
+                constants={"K": 105.0, "discount": 0.95},
+            ),
+            S_chunks,
+        )
+        rows = executor.map(program.eval_batch_np, arr_chunks)
+        natives = executor.map(native, arr_chunks)
+        
+        assert np.array_equal(np.concatenate(list(bindings)), expected)
+        assert np.array_equal(np.concatenate(list(rows)), expected)
+        assert np.array_equal(np.concatenate(list(natives)), expected)
+
+
+def test_finance_bs_constants():
+    """Test Black-Scholes constant precomputation"""
+    bs = matheval.finance.bs_constants(100.0, 1.0, 0.05, 0.2)
+    
+    assert abs(bs.discount - math.exp(-0.05)) < 1e-12
+    assert abs(bs.drift - 0.03) < 1e-12
+    assert abs(bs.vol_part - 0.2) < 1e-12
+    assert abs(bs.S_det - 100.0 * math.exp(0.03)) < 1e-12
+    
+    # Unpacks like a tuple, in field order
+    discount, drift, vol_part, S_det = bs
+    assert (discount, drift, vol_part, S_det) == (bs.discount, bs.drift, bs.vol_part, bs.S_det)
+    assert len(bs) == 4
+    assert repr(bs).startswith("BSConstants(discount=")
+
+
+def test_finance_submodule_import():
+    """Test the finance submodule is importable by its dotted name"""
+    import matheval.finance as finance
+    from matheval.finance import bs_constants
+    
+    assert finance is matheval.finance
+    assert bs_constants(100.0, 1.0, 0.05, 0.2).discount == finance.bs_constants(100.0, 1.0, 0.05, 0.2).discount
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])